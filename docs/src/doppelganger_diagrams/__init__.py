@@ -0,0 +1 @@
+# Doppelganger documentation diagrams package
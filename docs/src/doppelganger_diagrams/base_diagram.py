@@ -0,0 +1,46 @@
+"""
+Abstract base class for diagram generators.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from diagrams import Edge, Node, getdiagram
+
+
+class BaseDiagram(ABC):
+    """Abstract base class for all diagram generators.
+
+    Subclasses provide `name` and `file_name` as `ClassVar[str]` class attributes.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """The display name of the diagram."""
+        pass
+
+    @property
+    @abstractmethod
+    def file_name(self) -> str:
+        """The filename (without extension) for the generated diagram."""
+        pass
+
+    @property
+    def graph_attr(self) -> dict[str, str]:
+        """Graphviz graph attributes applied on top of the diagrams defaults.
+
+        Subclasses override it with a `ClassVar[dict[str, str]]` class attribute.
+        """
+        return {}
+
+    @abstractmethod
+    def generate(self) -> None:
+        """Generate the diagram content. This method should contain the diagram definition."""
+        pass
+
+    def connect(self, edges: Iterable[tuple[Node, Node, Edge]]) -> None:
+        """Add each (source, target, edge) connection to the active diagram."""
+        diagram = getdiagram()
+        for source, target, edge in edges:
+            diagram.connect(source, target, edge)
@@ -2,7 +2,7 @@
 
 from .components_architecture import (
     ComponentsArchitectureDiagram,
-    SidecarRelayArchitectureDiagram
+    SidecarRelayArchitectureDiagram,
 )
 
 __all__ = ["ComponentsArchitectureDiagram", "SidecarRelayArchitectureDiagram"]
@@ -0,0 +1,153 @@
+"""
+Components and Sidecar Relay Architecture diagram generators.
+"""
+
+from typing import ClassVar
+
+from diagrams import Cluster, Edge
+
+from ..base_diagram import BaseDiagram
+
+# Edge templates. BaseDiagram.connect() only reads their attributes, so a
+# single instance is shared by every connection drawn with it.
+_FORWARD = Edge(forward=True)
+_BACK = Edge(reverse=True)
+_BOTH = Edge(forward=True, reverse=True)
+_DOTTED = Edge(style="dotted")
+_DOTTED_FORWARD = Edge(forward=True, style="dotted")
+_TCP_FORWARD = Edge(forward=True, label="TCP")
+_TCP_BACK = Edge(reverse=True, label="TCP")
+_HTTP = Edge(forward=True, label="HTTP")
+_PRIMARY = Edge(forward=True, label="Primary")
+_MIRROR = Edge(forward=True, label="Mirror 100%", style="dashed")
+_TELEMETRY = Edge(forward=True, label="Telemetry", style="dotted")
+_LOGS = Edge(forward=True, label="Logs")
+
+
+class ComponentsArchitectureDiagram(BaseDiagram):
+    """Components Architecture diagram implementation."""
+
+    name: ClassVar[str] = "Comonents Architecture"
+    file_name: ClassVar[str] = "components_architecture"
+
+    def generate(self) -> None:
+        """Generate the components architecture diagram."""
+        from diagrams.generic.compute import Rack
+        from diagrams.generic.network import Router, Switch
+        from diagrams.onprem.client import Client
+        from diagrams.onprem.container import Docker
+        from diagrams.onprem.database import PostgreSQL
+        from diagrams.onprem.inmemory import Redis
+        from diagrams.onprem.monitoring import Grafana, Prometheus
+        from diagrams.onprem.queue import Kafka
+
+        with Cluster("Internet"):
+            client = Client("Client")
+            server = Rack("Server")
+
+        with Cluster("Doppelganger"):
+            comparator = Rack("Behavior Comparator")
+            db = PostgreSQL("DB")
+            proxy = Router("Proxy")
+            grafana = Grafana("Dashboard")
+            kafka = Kafka("Kafka")
+            prometheus = Prometheus("Prometheus")
+            redis = Redis("Cache")
+            replicator = Switch("Request Replicator")
+
+        with Cluster("Service"):
+            master = Docker("Master")
+            with Cluster("Shadows"):
+                shadow1 = Docker("Shadow 1")
+                shadowx = Docker("Shadow x")
+
+        self.connect(
+            [
+                (proxy, master, _FORWARD),
+                (proxy, kafka, _FORWARD),
+                (proxy, master, _BACK),
+                (replicator, shadowx, _BOTH),
+                (replicator, shadow1, _BOTH),
+                (shadow1, shadowx, _DOTTED),
+                (client, proxy, _TCP_FORWARD),
+                (server, proxy, _TCP_BACK),
+                (kafka, replicator, _FORWARD),
+                (replicator, kafka, _FORWARD),
+                (replicator, redis, _FORWARD),
+                (comparator, db, _FORWARD),
+                (kafka, comparator, _FORWARD),
+                (comparator, prometheus, _FORWARD),
+                (prometheus, grafana, _FORWARD),
+            ]
+        )
+
+
+class SidecarRelayArchitectureDiagram(BaseDiagram):
+    """Sidecar Relay Architecture diagram with implemented infrastructure."""
+
+    name: ClassVar[str] = "Sidecar Relay Architecture"
+    file_name: ClassVar[str] = "sidecar_relay_architecture"
+
+    def generate(self) -> None:
+        """Generate the sidecar relay architecture diagram."""
+        from diagrams.generic.compute import Rack
+        from diagrams.generic.network import Router, Switch
+        from diagrams.onprem.client import Client
+        from diagrams.onprem.container import Docker
+        from diagrams.onprem.database import PostgreSQL
+        from diagrams.onprem.inmemory import Redis
+
+        with Cluster("Internet"):
+            client = Client("Client")
+
+        with Cluster("Kubernetes + Istio"):
+            with Cluster("Istio Gateway"):
+                istio_gateway = Router("Istio Gateway")
+
+            with Cluster("Primary Service Pod"):
+                with Cluster("Istio Sidecar"):
+                    envoy_primary = Router("Envoy Proxy")
+                primary_service = Docker("Primary Service\n(Rust v1)")
+
+            with Cluster("Shadow Service Pod"):
+                with Cluster("Istio Sidecar"):
+                    envoy_shadow = Router("Envoy Proxy")
+                shadow_service = Docker("Shadow Service\n(Go v2)")
+                relay_sidecar = Switch("Relay Sidecar\n(Rust)")
+
+            with Cluster("Monitoring"):
+                monitor_service = Rack("Monitor Service\n(Rust)")
+
+            with Cluster("Storage"):
+                postgresql = PostgreSQL("PostgreSQL\n(Comparison Results)")
+                redis = Redis("Redis\n(Cache)")
+
+            with Cluster("Future Comparison"):
+                comparator = Rack("Comparator\n(Offline Analysis)")
+
+        self.connect(
+            [
+                # Client request flow
+                (client, istio_gateway, _HTTP),
+                # Primary traffic flow (no latency impact)
+                (istio_gateway, envoy_primary, _PRIMARY),
+                (envoy_primary, primary_service, _FORWARD),
+                (primary_service, envoy_primary, _FORWARD),
+                (envoy_primary, istio_gateway, _FORWARD),
+                (istio_gateway, client, _FORWARD),
+                # Mirror traffic flow (shadow)
+                (istio_gateway, envoy_shadow, _MIRROR),
+                (envoy_shadow, relay_sidecar, _FORWARD),
+                (relay_sidecar, shadow_service, _FORWARD),
+                (shadow_service, relay_sidecar, _FORWARD),
+                # Monitoring (async, no latency impact)
+                (envoy_primary, monitor_service, _TELEMETRY),
+                (monitor_service, postgresql, _FORWARD),
+                # Relay logging
+                (relay_sidecar, postgresql, _LOGS),
+                (relay_sidecar, redis, _FORWARD),
+                # Future comparison processing
+                (postgresql, comparator, _DOTTED_FORWARD),
+                (redis, comparator, _DOTTED_FORWARD),
+            ]
+        )
@@ -0,0 +1,170 @@
+"""
+Staleness checks and a content-addressed cache for generated diagrams.
+
+A diagram is up to date when its output is newer than the sources that
+define it and the stamp stored next to the output matches its render key.
+The key covers the diagram's generate() code, the module globals it
+references, the source of the module defining it (helper methods and
+functions included), its name and graph attributes, the output format, the
+BaseDiagram source, the installed diagrams version and the render settings
+supplied by the caller. Rendered outputs are also kept under the
+cache directory by that key, so an identical diagram is copied back instead
+of rendered again after a rename or a branch switch.
+"""
+
+import hashlib
+import inspect
+import logging
+import shutil
+from functools import cache
+from importlib.metadata import version
+from pathlib import Path
+from types import CodeType, FunctionType, ModuleType
+
+from diagrams import Edge
+
+from .base_diagram import BaseDiagram
+
+STAMP_SUFFIX = ".stamp"
+CACHE_DIRECTORY = Path(".diagram_cache")
+
+logger = logging.getLogger(__name__)
+
+
+def _stable_repr(value: object) -> str:
+    """repr() that does not depend on memory addresses or hash randomization."""
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    if value is Ellipsis:
+        return "..."
+    if isinstance(value, CodeType):
+        return _code_digest(value)
+    if isinstance(value, (tuple, list)):
+        return f"({','.join(map(_stable_repr, value))})"
+    if isinstance(value, (set, frozenset)):
+        return f"{{{','.join(sorted(map(_stable_repr, value)))}}}"
+    if isinstance(value, dict):
+        items = sorted(f"{_stable_repr(k)}:{_stable_repr(v)}" for k, v in value.items())
+        return f"{{{','.join(items)}}}"
+    if isinstance(value, Edge):
+        return f"Edge{_stable_repr(value.attrs)}"
+    if isinstance(value, ModuleType):
+        return value.__name__
+    if isinstance(value, (type, FunctionType)):
+        return f"{value.__module__}.{value.__qualname__}"
+    raise ValueError(f"no stable representation for {type(value).__qualname__}")
+
+
+def _code_names(code: CodeType) -> set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _code_digest(code: CodeType) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(code.co_code)
+    hasher.update(_stable_repr((code.co_names, code.co_varnames)).encode())
+    hasher.update(_stable_repr(code.co_consts).encode())
+    return hasher.hexdigest()
+
+
+def generate_digest(diagram: BaseDiagram) -> str:
+    """Stable digest of generate() and the module globals it references.
+
+    Raises ValueError when a referenced global has no stable representation.
+    """
+    generate = type(diagram).generate
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(_code_digest(generate.__code__).encode())
+    for name in sorted(_code_names(generate.__code__)):
+        if name in generate.__globals__:
+            value = _stable_repr(generate.__globals__[name])
+            hasher.update(f"{name}={value}".encode())
+    return hasher.hexdigest()
+
+
+def _source_digest(cls: type) -> str:
+    """Digest of the source file defining `cls`."""
+    source = Path(inspect.getfile(cls)).read_bytes()
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+@cache
+def _environment() -> str:
+    """Rendering inputs shared by every diagram: BaseDiagram and diagrams itself."""
+    return f"{_source_digest(BaseDiagram)} diagrams=={version('diagrams')}"
+
+
+class RenderCache:
+    """Stamps and cached outputs for diagrams rendered with fixed settings."""
+
+    def __init__(self, settings: object, directory: Path = CACHE_DIRECTORY) -> None:
+        """
+        :param settings: Everything outside the diagram classes that affects the
+            rendered output, e.g. Diagram arguments and the dot command line.
+        :param directory: Where rendered outputs are cached.
+        """
+        self.settings = _stable_repr(settings)
+        self.directory = directory
+
+    def key(self, diagram: BaseDiagram, output: Path) -> str | None:
+        """Render key of `diagram` at `output`, None if it cannot be computed."""
+        try:
+            fingerprint = (
+                generate_digest(diagram),
+                _source_digest(type(diagram)),
+                diagram.name,
+                diagram.graph_attr,
+                output.suffix,
+                _environment(),
+                self.settings,
+            )
+            text = _stable_repr(fingerprint)
+        except ValueError as e:
+            logger.warning("    ! Not caching %s: %s", diagram.name, e)
+            return None
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def is_up_to_date(self, diagram: BaseDiagram, output: Path) -> bool:
+        """Whether `output` can be reused instead of rendering the diagram again."""
+        stamp = output.with_suffix(STAMP_SUFFIX)
+        if not output.exists() or not stamp.exists():
+            return False
+
+        sources = (inspect.getfile(type(diagram)), inspect.getfile(BaseDiagram))
+        source_mtime = max(Path(source).stat().st_mtime for source in sources)
+        if output.stat().st_mtime <= source_mtime:
+            return False
+
+        key = self.key(diagram, output)
+        return key is not None and stamp.read_text() == key
+
+    def write_stamp(self, diagram: BaseDiagram, output: Path) -> None:
+        """Record the render key that produced `output`."""
+        key = self.key(diagram, output)
+        if key is not None:
+            output.with_suffix(STAMP_SUFFIX).write_text(key)
+
+    def restore(self, diagram: BaseDiagram, output: Path) -> bool:
+        """Copy a previously rendered identical diagram to `output`, if cached."""
+        key = self.key(diagram, output)
+        if key is None:
+            return False
+        cached = self.directory / f"{key}{output.suffix}"
+        if not cached.exists():
+            return False
+        output.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached, output)
+        self.write_stamp(diagram, output)
+        return True
+
+    def store(self, diagram: BaseDiagram, output: Path) -> None:
+        """Add a freshly rendered `output` to the cache."""
+        key = self.key(diagram, output)
+        if key is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output, self.directory / f"{key}{output.suffix}")
@@ -3,16 +3,59 @@ Main script to generate all diagrams.
 Run with: uv run src/main.py
 """
 
-from diagram_generators.components_architecture import ComponentsArchitectureDiagram, SidecarRelayArchitectureDiagram
-from diagrams import Diagram
-from pathlib import Path
+import base64
+import html
+import logging
+import mimetypes
+import os
+import re
+import shutil
+import subprocess
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, partial
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing import Queue
+from pathlib import Path
+from types import TracebackType
+
+from diagrams import Diagram, setdiagram
+from doppelganger_diagrams import render_cache
+from doppelganger_diagrams.base_diagram import BaseDiagram
+from doppelganger_diagrams.diagram_generators import (
+    ComponentsArchitectureDiagram,
+    SidecarRelayArchitectureDiagram,
+)
+
+OUTPUT_DIRECTORY = Path("diagrams")
+FILE_EXTENTION = "svg"
+
+# Icons are referenced by absolute path into the diagrams package
+_IMAGE_HREF = re.compile(r'(<image\b[^>]*?\bxlink:href=")([^"]+)"')
+
+logger = logging.getLogger(__name__)
 
-src_path = Path(__file__).parent
-sys.path.insert(0, str(src_path))
 
-OUTPUT_DIRECTORY = "diagrams"
-FILE_EXTENTION = "jpg"
+class _SourceOnlyDiagram(Diagram):
+    """Diagram context that writes its graphviz source instead of rendering it."""
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.dot.save()
+        setdiagram(None)
+
+
+# Diagram context with the arguments shared by every generator bound once
+_new_diagram = partial(_SourceOnlyDiagram, show=False, outformat=FILE_EXTENTION)
+
+# -O names each output after its input file plus the format extension
+_DOT_ARGS = (f"-T{FILE_EXTENTION}", "-O")
 
 
 # List of all diagrams
@@ -22,35 +65,184 @@ _GENERATORS = [
 ]
 
 
-def main():
-    """Generate all diagrams."""
-    diagrams_dir = Path(OUTPUT_DIRECTORY)
-    diagrams_dir.mkdir(exist_ok=True)
+@cache
+def _find_dot() -> str | None:
+    """Resolve the graphviz `dot` executable once per process."""
+    return shutil.which("dot")
 
-    print("Generating diagrams...")
 
-    # Generate each diagram
-    for diagram in _GENERATORS:
-        path = f"{OUTPUT_DIRECTORY}/{diagram.file_name}"
-        try:
-            print(f"  • Generating {diagram.name}...")
+def _dot_version() -> str:
+    """Version banner of `dot`, which it prints on stderr."""
+    result = subprocess.run(
+        [_find_dot(), "-V"], check=True, capture_output=True, text=True
+    )
+    return (result.stdout + result.stderr).strip()
+
+
+def _run_dot(paths: Iterable[Path]) -> None:
+    """Render graphviz source files next to themselves."""
+    subprocess.run(
+        [_find_dot(), *_DOT_ARGS, *map(str, paths)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _warm_font_cache() -> None:
+    """Bring the fontconfig cache up to date before any dot process starts."""
+    fc_cache = shutil.which("fc-cache")
+    if fc_cache is not None:
+        subprocess.run([fc_cache], check=False, capture_output=True)
+
+
+def _init_worker(queue: Queue) -> None:
+    """Route worker log records to the listener in the parent process."""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(queue)]
+    root.setLevel(logging.INFO)
+
+
+def _output_path(diagram: BaseDiagram) -> Path:
+    """Location of the rendered diagram, extension included."""
+    return OUTPUT_DIRECTORY / f"{diagram.file_name}.{FILE_EXTENTION}"
+
+
+def _data_uri(match: re.Match[str]) -> str:
+    path = Path(html.unescape(match[2]))
+    if not path.is_file():
+        return match[0]
+    mime_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    data = base64.b64encode(path.read_bytes()).decode("ascii")
+    return f'{match[1]}data:{mime_type};base64,{data}"'
 
-            with Diagram(
+
+def _inline_images(output: Path) -> None:
+    """Embed the icons of an SVG output so it renders away from this machine."""
+    if output.suffix == ".svg":
+        svg = output.read_text(encoding="utf-8")
+        output.write_text(_IMAGE_HREF.sub(_data_uri, svg), encoding="utf-8")
+
+
+def _report_failure(diagram: BaseDiagram, reason: object) -> None:
+    logger.error(
+        '    ✗ Error generating %s at "%s": %s',
+        diagram.name,
+        _output_path(diagram),
+        reason,
+    )
+
+
+def _render_batch(batch: list[BaseDiagram], outputs: render_cache.RenderCache) -> None:
+    """Write the source of each diagram, then render them in one `dot` call."""
+    OUTPUT_DIRECTORY.mkdir(parents=True, exist_ok=True)
+
+    sources = {}
+    for diagram in batch:
+        output = _output_path(diagram)
+        path = output.with_suffix("")
+        logger.info("  • Generating %s...", diagram.name)
+        try:
+            with _new_diagram(
                 name=diagram.name,
-                show=False,
-                outformat=FILE_EXTENTION,
-                filename=path,
+                filename=str(path),
+                graph_attr=diagram.graph_attr,
             ):
                 diagram.generate()
-            print(
-                f'    ✓ {diagram.name} generated successfully at "{path}.{FILE_EXTENTION}"'
-            )
         except Exception as e:
-            print(
-                f'    ✗ Error generating {diagram.name} at "{path}.{FILE_EXTENTION}": {e}'
-            )
+            _report_failure(diagram, e)
+            continue
+        sources[diagram] = path
+
+    if not sources:
+        return
+
+    rendered = list(sources)
+    try:
+        try:
+            _run_dot(sources.values())
+        except subprocess.CalledProcessError:
+            # One bad graph fails the whole call, so render each on its own
+            # to report only the diagrams dot rejects
+            for diagram, path in sources.items():
+                try:
+                    _run_dot([path])
+                except subprocess.CalledProcessError as e:
+                    _report_failure(diagram, e.stderr.strip())
+                    rendered.remove(diagram)
+    except OSError as e:
+        for diagram in rendered:
+            _report_failure(diagram, e)
+        return
+    finally:
+        for path in sources.values():
+            path.unlink(missing_ok=True)
+
+    for diagram in rendered:
+        output = _output_path(diagram)
+        try:
+            _inline_images(output)
+            outputs.store(diagram, output)
+            outputs.write_stamp(diagram, output)
+        except OSError as e:
+            _report_failure(diagram, e)
+            continue
+        logger.info('    ✓ %s generated successfully at "%s"', diagram.name, output)
+
+
+def main() -> None:
+    """Generate all diagrams."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
+    if _find_dot() is None:
+        sys.exit("Graphviz `dot` executable not found on PATH")
+
+    # Outputs are only reused when rendered with the same settings and dot
+    outputs = render_cache.RenderCache(
+        (
+            _new_diagram.func.__qualname__,
+            _new_diagram.keywords,
+            _DOT_ARGS,
+            _dot_version(),
+        )
+    )
+
+    logger.info("Generating diagrams...")
+
+    stale = []
+    for diagram in _GENERATORS:
+        output = _output_path(diagram)
+        if outputs.is_up_to_date(diagram, output):
+            logger.info("  • %s is up to date, skipping", diagram.name)
+        elif outputs.restore(diagram, output):
+            logger.info('  • %s restored from cache at "%s"', diagram.name, output)
+        else:
+            stale.append(diagram)
+
+    if not stale:
+        logger.info("\nAll diagrams up to date!")
+        return
+
+    # dot processes then find a current font cache instead of rescanning fonts
+    _warm_font_cache()
+
+    # Workers log through a queue so only the listener thread writes output
+    queue = Queue()
+    listener = QueueListener(queue, *logging.getLogger().handlers)
+    listener.start()
+    try:
+        # Each worker renders its share of the diagrams with a single dot
+        # process, so startup and font loading are paid once per worker
+        workers = min(len(stale), os.cpu_count() or 1)
+        batches = [stale[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(queue,)
+        ) as executor:
+            list(executor.map(partial(_render_batch, outputs=outputs), batches))
+    finally:
+        listener.stop()
 
-    print("\nAll diagrams generated!")
+    logger.info("\nAll diagrams generated!")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,192 @@
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from diagrams import Edge
+from doppelganger_diagrams import render_cache
+from doppelganger_diagrams.base_diagram import BaseDiagram
+from doppelganger_diagrams.render_cache import RenderCache, generate_digest
+
+_EDGE = Edge(color="black")
+_UNSTABLE = object()
+
+
+class _Diagram(BaseDiagram):
+    name: ClassVar[str] = "Test"
+    file_name: ClassVar[str] = "test"
+
+    def generate(self) -> None:
+        for kind in ("a", "b"):
+            if kind in {"a", "c", "d"}:
+                print(_EDGE)
+
+
+class _OtherBody(_Diagram):
+    def generate(self) -> None:
+        for kind in ("a", "b"):
+            if kind in {"a", "c", "e"}:
+                print(_EDGE)
+
+
+class _Unstable(_Diagram):
+    def generate(self) -> None:
+        print(_UNSTABLE)
+
+
+_DIGEST_SCRIPT = """
+from doppelganger_diagrams.render_cache import generate_digest
+import test_render_cache
+print(generate_digest(test_render_cache._Diagram()))
+"""
+
+
+def _digest_with_hash_seed(seed: str) -> str:
+    env = os.environ | {"PYTHONHASHSEED": seed}
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(Path(__file__).parent), str(Path(__file__).parents[1] / "src")]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", _DIGEST_SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def output(tmp_path: Path) -> Path:
+    output = tmp_path / "out" / "test.svg"
+    output.parent.mkdir()
+    output.write_text("<svg/>")
+    return output
+
+
+def test_digest_is_stable_across_hash_seeds() -> None:
+    digests = {_digest_with_hash_seed(seed) for seed in ("0", "1", "2", "3")}
+    assert len(digests) == 1
+    assert digests == {generate_digest(_Diagram())}
+
+
+def test_digest_changes_with_body() -> None:
+    assert generate_digest(_Diagram()) != generate_digest(_OtherBody())
+
+
+def test_digest_changes_with_referenced_edge(monkeypatch: pytest.MonkeyPatch) -> None:
+    before = generate_digest(_Diagram())
+    monkeypatch.setattr(sys.modules[__name__], "_EDGE", Edge(color="red"))
+    assert generate_digest(_Diagram()) != before
+
+
+def test_unstable_global_is_not_cached(tmp_path: Path, output: Path) -> None:
+    cache = RenderCache(settings=(), directory=tmp_path / "cache")
+    assert cache.key(_Unstable(), output) is None
+
+    cache.store(_Unstable(), output)
+    cache.write_stamp(_Unstable(), output)
+    assert not (tmp_path / "cache").exists()
+    assert not output.with_suffix(".stamp").exists()
+    assert not cache.is_up_to_date(_Unstable(), output)
+
+
+def test_stamp_is_required(tmp_path: Path, output: Path) -> None:
+    cache = RenderCache(settings=(), directory=tmp_path / "cache")
+    assert not cache.is_up_to_date(_Diagram(), output)
+
+    cache.write_stamp(_Diagram(), output)
+    assert cache.is_up_to_date(_Diagram(), output)
+
+
+def test_stamp_is_invalidated_by_settings(tmp_path: Path, output: Path) -> None:
+    RenderCache(settings={"direction": "LR"}).write_stamp(_Diagram(), output)
+    cache = RenderCache(settings={"direction": "TB"}, directory=tmp_path / "cache")
+    assert not cache.is_up_to_date(_Diagram(), output)
+
+
+def test_stamp_is_invalidated_by_newer_source(tmp_path: Path, output: Path) -> None:
+    cache = RenderCache(settings=(), directory=tmp_path / "cache")
+    cache.write_stamp(_Diagram(), output)
+    os.utime(output, (0, 0))
+    assert not cache.is_up_to_date(_Diagram(), output)
+
+
+def test_restore_copies_cached_output(tmp_path: Path, output: Path) -> None:
+    cache = RenderCache(settings=(), directory=tmp_path / "cache")
+    assert not cache.restore(_Diagram(), output)
+
+    cache.store(_Diagram(), output)
+    restored = tmp_path / "restored" / "test.svg"
+    assert cache.restore(_Diagram(), restored)
+    assert restored.read_text() == "<svg/>"
+    assert cache.is_up_to_date(_Diagram(), restored)
+
+
+def test_cache_is_invalidated_by_settings(tmp_path: Path, output: Path) -> None:
+    RenderCache(settings="dot 1", directory=tmp_path).store(_Diagram(), output)
+    cache = RenderCache(settings="dot 2", directory=tmp_path)
+    assert not cache.restore(_Diagram(), tmp_path / "restored.svg")
+
+
+def test_cache_is_invalidated_by_name(tmp_path: Path, output: Path) -> None:
+    class _Renamed(_Diagram):
+        name: ClassVar[str] = "Renamed"
+
+    cache = RenderCache(settings=(), directory=tmp_path)
+    cache.store(_Diagram(), output)
+    assert not cache.restore(_Renamed(), tmp_path / "restored.svg")
+
+
+def test_cache_is_invalidated_by_diagrams_version(
+    tmp_path: Path, output: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = RenderCache(settings=(), directory=tmp_path)
+    cache.store(_Diagram(), output)
+
+    render_cache._environment.cache_clear()
+    monkeypatch.setattr(render_cache, "version", lambda _: "0.0.0")
+    try:
+        assert not cache.restore(_Diagram(), tmp_path / "restored.svg")
+    finally:
+        render_cache._environment.cache_clear()
+
+
+_HELPER_MODULE = """
+from typing import ClassVar
+
+from doppelganger_diagrams.base_diagram import BaseDiagram
+
+
+class HelperDiagram(BaseDiagram):
+    name: ClassVar[str] = "Helper"
+    file_name: ClassVar[str] = "helper"
+
+    def generate(self) -> None:
+        self._nodes()
+
+    def _nodes(self) -> None:
+        print({nodes!r})
+"""
+
+
+def test_cache_is_invalidated_by_helper_method(
+    tmp_path: Path, output: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    module_path = tmp_path / "helper_diagram.py"
+    module_path.write_text(_HELPER_MODULE.format(nodes="a"))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    module = importlib.import_module("helper_diagram")
+    monkeypatch.setitem(sys.modules, "helper_diagram", module)
+
+    cache = RenderCache(settings=(), directory=tmp_path / "cache")
+    cache.store(module.HelperDiagram(), output)
+
+    module_path.write_text(_HELPER_MODULE.format(nodes="a, b"))
+    module = importlib.reload(module)
+    assert not cache.restore(module.HelperDiagram(), tmp_path / "restored.svg")